@@ -1,18 +1,36 @@
+from copy import deepcopy
 from datetime import timedelta
+from functools import cached_property
 import os
-from typing import Any, Dict
-
-import json
+from typing import Any, Dict, Optional
 
+import serialization
 from utils import *
 
 
 _ERROR_MSG_INVALID_OUTPUT = "Output path doesn't exist!"
 _ERROR_MSG_OUTPUT_NOT_DIR = "Output path must be a directory"
 
+# Entries added to config files that predate them.
+_DEFAULT_ENTRIES: Dict[str, Dict[str, Any]] = {
+    "max_concurrency": {
+        "value": 8,
+        "description": "Max Concurrency [Integer]: Date ranges scraped and requests in flight at once. (Default 8)",
+    },
+    "scraped_ranges": {
+        "value": {},
+        "description": "Scraped Ranges [Object]: Next offset to fetch per date range of the unfinished batch, null once done. Managed by the scraper.",
+    },
+}
+
 
 class Config:
-    """Holds configuration data from "config.json" file."""
+    """Holds configuration data from "config.json" file.
+
+    Settings that never change during a run are cached after their first
+    access. `total` and `last_scraped_date` are re-read on every access
+    since `update` modifies them.
+    """
 
     def __init__(self, config_file_path: str) -> None:
         assert os.path.exists(
@@ -20,9 +38,15 @@ class Config:
         assert self.is_json_file(
             config_file_path), f"Config file at {config_file_path} is not a json file"
         self.config_file_path: str = config_file_path
+        self.log_file_name: str = datetime.now().strftime(
+            "%d-%m-%Y %I-%M-%S %p.log"
+        )
 
-        with open(self.config_file_path) as config_fp:
-            self.configs: Dict[str, Any] = json.load(config_fp)
+        with open(self.config_file_path, "rb") as config_fp:
+            self.configs: Dict[str, Any] = serialization.loads(config_fp.read())
+
+        for key, entry in _DEFAULT_ENTRIES.items():
+            self.configs.setdefault(key, deepcopy(entry))
 
         assert os.path.exists(
             self.output_dir), f"Output path {self.output_dir} doesn't exist!"
@@ -43,7 +67,7 @@ class Config:
             self.configs["start_date"]["value"]
         )
 
-    @property
+    @cached_property
     def log_level(self) -> int:
         """Log level of Python Logger.
 
@@ -55,17 +79,17 @@ class Config:
         """
         return self.configs["log_level"]["value"]
 
-    @property
+    @cached_property
     def log_message_format(self) -> str:
         """Log format for Python logger."""
         return self.configs["log_message_format"]["value"]
 
-    @property
+    @cached_property
     def time_delta(self) -> timedelta:
         """Number of days whose articles should be fetched together."""
         return timedelta(days=int(self.configs["threshold"]["value"]))
 
-    @property
+    @cached_property
     def limit(self) -> int:
         """Number of articles to fetch in one request."""
         return self.configs["limit"]["value"]
@@ -75,27 +99,33 @@ class Config:
         """Number of articles scrapped so far."""
         return self.configs["total"]["value"]
 
-    @property
+    @cached_property
     def max_attempts(self) -> int:
         """Max number of attempts a request can fail before moving on."""
         return self.configs["max_attempts"]["value"]
 
-    @property
+    @cached_property
+    def max_concurrency(self) -> int:
+        """Number of date ranges scraped concurrently, which is also the
+        maximum number of requests in flight at once."""
+        return self.configs["max_concurrency"]["value"]
+
+    @cached_property
     def output_dir(self) -> str:
         """Directory path where news articles are to be saved."""
         return self.configs["output_directory"]["value"]
 
-    @property
+    @cached_property
     def min_sleep_time(self) -> int:
         """Minimum number of seconds the scraper must sleep in between requests."""
         return self.configs["min_sleep_time"]["value"]
 
-    @property
+    @cached_property
     def max_sleep_time(self) -> int:
         """Maximum number of days to go without finding a single news article."""
         return self.configs["max_sleep_time"]["value"]
 
-    @property
+    @cached_property
     def log_file_path(self) -> str:
         """File path to which log messages will be saved.
 
@@ -105,12 +135,6 @@ class Config:
         Example: 21-01-2021 11:12:13 AM.log
         """
         log_dir = self.configs["log_directory"]["value"]
-
-        if not hasattr(self, "log_file_name"):
-            format_string: str = "%d-%m-%Y %I-%M-%S %p"
-            time_prefix_string: str = datetime.now().strftime(format_string)
-            self.log_file_name: str = f"{time_prefix_string}.log"
-
         return os.path.join(log_dir, self.log_file_name)
 
     def update(self, newly_added: int, last_scrapped_date: datetime) -> None:
@@ -120,13 +144,65 @@ class Config:
             added (int): New articles added.
             last_scrapped_date (datetime): Last date upto which articles were scrapped.
         """
+        self.update_in_memory(newly_added, last_scrapped_date)
+        self.flush()
+
+    def update_in_memory(
+        self,
+        newly_added: int,
+        last_scrapped_date: Optional[datetime] = None,
+    ) -> None:
+        """Update last scraped date and total scraped information without
+        writing to the config file. Call `flush` to persist the changes.
+
+        Args:
+            newly_added (int): New articles added.
+            last_scrapped_date (datetime, optional): Last date upto which articles
+                were scrapped. Left unchanged if None. Otherwise progress of date
+                ranges before it is no longer needed and is cleared.
+        """
         self.configs["total"]["value"] += newly_added
-        self.configs["last_scraped_date"]["value"] = date_to_string(
-            last_scrapped_date
+
+        if last_scrapped_date is not None:
+            self.configs["last_scraped_date"]["value"] = date_to_string(
+                last_scrapped_date
+            )
+            self.configs["scraped_ranges"]["value"] = {}
+
+    def range_next_offset(self, date_start: datetime) -> Optional[int]:
+        """Next offset to fetch for the date range starting at `date_start`.
+
+        Args:
+            date_start (datetime): Start date of the date range.
+
+        Returns:
+            Optional[int]: Next offset to fetch. None if the range is done.
+        """
+        return self.configs["scraped_ranges"]["value"].get(
+            date_to_string(date_start), 0
         )
 
-        with open(self.config_file_path, "w") as config_fp:
-            json.dump(self.configs, config_fp)
+    def update_range_in_memory(
+        self,
+        date_start: datetime,
+        next_offset: Optional[int],
+        newly_added: int,
+    ) -> None:
+        """Record progress of the date range starting at `date_start` without
+        writing to the config file. Call `flush` to persist the changes.
+
+        Args:
+            date_start (datetime): Start date of the date range.
+            next_offset (int, optional): Next offset to fetch. None if the range is done.
+            newly_added (int): New articles added.
+        """
+        self.configs["scraped_ranges"]["value"][date_to_string(date_start)] = next_offset
+        self.update_in_memory(newly_added)
+
+    def flush(self) -> None:
+        """Writes current configuration values to the config file."""
+        with open(self.config_file_path, "wb") as config_fp:
+            config_fp.write(serialization.dumps(self.configs))
 
     def __repr__(self) -> str:
         return "\n".join([
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, Iterable, List, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemModel:
     """Holds information related to a single news article."""
 
@@ -27,8 +27,8 @@ class ItemModel:
     id: str = None
     word_count: int = None
 
-    def to_list(self) -> List:
-        return [
+    def to_list(self) -> Tuple:
+        return (
             self.id,
             self.headline,
             self.subheadline,
@@ -49,11 +49,11 @@ class ItemModel:
             self.created_at,
             self.updated_at,
             self.content_updated_at,
-        ]
+        )
 
 
 class ItemsModel:
-    """Holds data for multiple news articles in a list."""
+    """Holds data for multiple news articles as one list per column."""
 
     COLUMN_NAMES: List[str] = [
         "text_id",
@@ -79,17 +79,30 @@ class ItemsModel:
     ]
 
     def __init__(self) -> None:
-        self.items: List[ItemModel] = []
+        self.columns: Dict[str, List] = {
+            column_name: []
+            for column_name in self.COLUMN_NAMES
+        }
 
     def add(self, item: ItemModel):
-        if self.is_acceptable(item):
-            self.items.append(item)
+        self.extend((item,))
+
+    def extend(self, items: Iterable[ItemModel]):
+        rows = [
+            item.to_list()
+            for item in items
+            if self.is_acceptable(item)
+        ]
+
+        for column, values in zip(self.columns.values(), zip(*rows)):
+            column.extend(values)
 
     def __len__(self) -> int:
         """Returns the number of parsed articles."""
-        return len(self.items)
+        return len(self.columns[self.COLUMN_NAMES[0]])
 
-    def is_acceptable(self, item: ItemModel) -> bool:
+    @staticmethod
+    def is_acceptable(item: ItemModel) -> bool:
         """Checks whether `item` is acceptable.
 
         An item is acceptable iff it has a non-null and non-empty 
@@ -101,13 +114,4 @@ class ItemsModel:
         # Returns
             bool: True if the item should be added. False otherwise.
         """
-        if item.headline is not None and item.content is not None:
-            return len(item.headline) and len(item.content)
-
-        return False
-
-    def to_list(self) -> List:
-        return [
-            item.to_list()
-            for item in self.items
-        ]
+        return bool(item.headline) and bool(item.content)
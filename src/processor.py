@@ -1,11 +1,33 @@
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import os
 import re
 from typing import Dict, List, Tuple
 
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
 from config import Config
 from models import *
 from utils import setup_logger
 
+# Joins story elements before regex cleaning. Neither regex alternative
+# can match across it, so tags and entities never span two elements.
+_ELEMENT_SEPARATOR = "\x1f"
+_HTML_CLEANER = re.compile(r"<[^>\x1f]*>|&[^;\x1f]*;")
+
+# Millisecond timestamp fields converted to UNIX timestamps in seconds.
+_TIMESTAMP_FIELDS = (
+    "created-at",
+    "published-at",
+    "updated-at",
+    "last-published-at",
+    "first-published-at",
+    "content-updated-at",
+)
+
 
 class Processor:
     """Processes raw response json data."""
@@ -18,17 +40,21 @@ class Processor:
             log_level=self.config.log_level,
             log_message_format=self.config.log_message_format,
         )
+        self.pool = ThreadPoolExecutor(max_workers=os.cpu_count())
 
     def __call__(self, items_in: List[Dict]) -> ItemsModel:
         self.logger.debug(f"Raw unprocessed items: {len(items_in)}")
         items_out = ItemsModel()
 
-        for raw_item in items_in:
-            items_out.add(self.parse_data(raw_item))
+        items_out.extend(self.pool.map(self.parse_data, items_in))
 
         self.logger.debug(f"Filtered processed items: {len(items_out)}")
         return items_out
 
+    def close(self) -> None:
+        """Shuts down the thread pool used for parsing articles."""
+        self.pool.shutdown()
+
     def parse_data(self, item: Dict) -> ItemModel:
         """Parse article data into `ItemModel`.
 
@@ -48,24 +74,17 @@ class Processor:
         id = item.get("id", None)
         tags = self.construct_tags_text(item)
         content = self.construct_content_text(item)
-        created_at = self.to_unix_timestamp(
-            item.get("created-at", 0)
-        )
-        published_at = self.to_unix_timestamp(
-            item.get("published-at", 0)
-        )
-        updated_at = self.to_unix_timestamp(
-            item.get("updated-at", 0)
-        )
-        last_published_at = self.to_unix_timestamp(
-            item.get("last-published-at", 0)
-        )
-        first_published_at = self.to_unix_timestamp(
-            item.get("first-published-at", 0)
-        )
-        content_updated_at = self.to_unix_timestamp(
-            item.get("content-updated-at", 0)
-        )
+        (
+            created_at,
+            published_at,
+            updated_at,
+            last_published_at,
+            first_published_at,
+            content_updated_at,
+        ) = [
+            int(item.get(field, 0)) // 1000
+            for field in _TIMESTAMP_FIELDS
+        ]
         seo_description, seo_tags = self.parse_seo_data(item)
         authors = self.construct_authors_text(item)
         sections = self.construct_sections_text(item)
@@ -93,17 +112,6 @@ class Processor:
             content_updated_at=content_updated_at,
         )
 
-    def to_unix_timestamp(self, timestamp_string: Dict) -> int:
-        """Converts timestamp string to UNIX timestamp in seconds.
-
-        Args:
-            item (Dict): Raw news article data.
-
-        Returns:
-            int: UNIX Timestamp in seconds.
-        """
-        return int(int(timestamp_string) / 1000)
-
     def construct_authors_text(self, item: Dict) -> str:
         """Constructs comma separated author names.
 
@@ -132,22 +140,49 @@ class Processor:
         Returns:
             Tuple[str, str]: SEO Description and comma separated keywords.
         """
-        description: str = None
-        tags: str = None
+        seo: Dict = item.get("seo", None)
+
+        if not seo:
+            return None, None
+
+        description: str = seo.get("meta-description", None)
+        tags = seo.get("meta-keywords", None)
 
-        if "seo" in item.keys():
-            description = item.get("meta-description", None)
-            tags = item.get("meta-keywords", None)
+        if isinstance(tags, list):
+            tags = ",".join(
+                tag
+                for tag in tags
+                if tag is not None
+            )
 
         return description, tags
 
-    def construct_content_text(self, item):
-        return "".join([
-            self.clean_text(element["text"])
+    def construct_content_text(self, item: Dict) -> str:
+        """Constructs article content from its text story elements.
+
+        With selectolax each element is parsed on its own, since markup left
+        open in one element (e.g. a comment or `<script>`) would otherwise
+        swallow the elements after it. The regex fallback cleans all elements
+        in one call, joined with `_ELEMENT_SEPARATOR`, which is removed after.
+
+        # Parameters
+            `item` (Dict): Raw news article data.
+
+        # Returns
+            str: Cleaned article content.
+        """
+        texts: List[str] = [
+            element["text"]
             for card in item["cards"]
             for element in card["story-elements"]
             if element["type"] == "text"
-        ])
+        ]
+
+        if HTMLParser is not None:
+            return "".join([self.clean_text(text) for text in texts])
+
+        content = self.clean_text(_ELEMENT_SEPARATOR.join(texts))
+        return content.replace(_ELEMENT_SEPARATOR, "")
 
     def construct_tags_text(self, item: Dict) -> str:
         """Constructs tag string.
@@ -176,14 +211,23 @@ class Processor:
     def clean_text(self, text: str) -> str:
         """Removes HTML tags from `text` string.
 
+        Uses selectolax's HTML parser when it is installed and falls back
+        to a regex otherwise. Text without any tag or entity is returned
+        as is.
+
         # Parameters
             `text` (str): input text to be cleaned.
 
         # Returns
             str: Cleaned text.
         """
-        cleaner = re.compile("<.*?>|&.*;")
-        return re.sub(cleaner, "", text)
+        if "<" not in text and "&" not in text:
+            return text
+
+        if HTMLParser is not None:
+            return HTMLParser(text).text(separator="")
+
+        return _HTML_CLEANER.sub("", text)
 
     def construct_sections_text(self, item: Dict) -> str:
         """Constructs sections string.
@@ -201,10 +245,10 @@ class Processor:
                 section.get("name", None)
                 for section in sections
             ]
-            tags = ",".join(
+            sections = ",".join(
                 section
                 for section in sections
                 if section is not None
             )
 
-        return tags
+        return sections
@@ -1,12 +1,16 @@
+import asyncio
 import logging
-import time
+from random import uniform
 from datetime import datetime
 from typing import Dict
-import requests
+import httpx
 
+import serialization
 from config import Config
 from utils import setup_logger
 
+_REQUEST_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
 
 class Requester:
     """Fetches response from Prothom Alo website and returns json data."""
@@ -19,6 +23,8 @@ class Requester:
             log_level=self.config.log_level,
             log_message_format=self.config.log_message_format,
         )
+        self.client = httpx.AsyncClient(timeout=_REQUEST_TIMEOUT)
+        self.semaphore = asyncio.Semaphore(self.config.max_concurrency)
 
     @property
     def url_format(self) -> str:
@@ -36,7 +42,7 @@ class Requester:
             + "&published-after={start}&published-before={end}"
         )
 
-    def __call__(
+    async def __call__(
         self,
         date_start: datetime,
         date_end: datetime,
@@ -45,7 +51,8 @@ class Requester:
         """Fetches response json data.
 
         Fetches news article data that was published with in [`date_start`, `date_end`] 
-        and at `offset`.
+        and at `offset`. At most `config.max_concurrency` requests are in flight
+        at once across all callers.
 
         # Parameters
             `date_start` (datetime): Minimum date of publication.
@@ -65,25 +72,36 @@ class Requester:
                     date_end,
                     offset
                 )
-                response = requests.get(request_url)
-                return response.json()
+
+                async with self.semaphore:
+                    response = await self.client.get(request_url)
+
+                return serialization.loads(response.content)
             except Exception:
                 self.logger.warning(f"Attempt {attempt}: Request failed.")
-                self.wait(attempt)
+
+                if attempt < self.config.max_attempts:
+                    await self.wait(attempt)
 
         raise Exception("All request attempts failed.")
 
-    def wait(self, attempt: int):
+    async def wait(self, attempt: int):
         """Waits a certain amount of time after a request fails.
 
-        The larger the `attempt` value the longer we wait.
+        The wait doubles with every attempt, starting at 1s and capped at
+        60s, plus up to 1s of random jitter.
 
         Args:
             attempt (int): Attempt number.
         """
-        sleep_time = 30 * attempt
-        self.logger.log(f"Attempting {attempt+1}th time in {sleep_time}s.")
-        time.sleep(sleep_time)
+        sleep_time = min(2 ** (attempt - 1), 60) + uniform(0, 1)
+        self.logger.info(
+            f"Attempting {attempt+1}th time in {sleep_time:.2f}s.")
+        await asyncio.sleep(sleep_time)
+
+    async def close(self) -> None:
+        """Closes the underlying HTTP client and its pooled connections."""
+        await self.client.aclose()
 
     def construct_request_url(
         self,
@@ -1,13 +1,22 @@
 import os
 import logging
 from datetime import datetime
+from typing import Any, List
 
-import pandas as pd
+import pyarrow as pa
+from pyarrow import csv
 
 from config import Config
 from models import ItemsModel
 from utils import setup_logger
 
+# Output column types: "text_" columns are strings, while "int_" and
+# "date_" (UNIX timestamp) columns are integers.
+_SCHEMA = pa.schema([
+    (column_name, pa.string() if column_name.startswith("text_") else pa.int64())
+    for column_name in ItemsModel.COLUMN_NAMES
+])
+
 
 class Saver:
     """Saves processed news articles in disk in `output_dir`."""
@@ -22,19 +31,78 @@ class Saver:
         )
 
     def __call__(self, items_in: ItemsModel, current_date: datetime) -> None:
-        dataframe = pd.DataFrame(
-            items_in.to_list(),
-            columns=ItemsModel.COLUMN_NAMES,
-        )
+        table = self.construct_table(items_in)
         output_file_path = self.construct_output_filepath(current_date)
-        dataframe.to_csv(
-            output_file_path,
-            index=None,
-            header=not os.path.exists(output_file_path),
-            mode="a",
+        write_options = csv.WriteOptions(
+            include_header=not os.path.exists(output_file_path),
         )
+
+        with open(output_file_path, "ab") as output_fp:
+            csv.write_csv(table, output_fp, write_options=write_options)
+
         self.logger.info(f"Saved to file: {output_file_path}")
 
+    def construct_table(self, items_in: ItemsModel) -> pa.Table:
+        """Builds a columnar arrow table out of processed news articles.
+
+        # Parameters
+            `items_in` (ItemsModel): Processed news articles.
+
+        # Returns
+            pa.Table: Table with one column per `ItemsModel.COLUMN_NAMES` entry.
+        """
+        return pa.Table.from_arrays(
+            [
+                self.construct_column(items_in.columns[field.name], field)
+                for field in _SCHEMA
+            ],
+            schema=_SCHEMA,
+        )
+
+    def construct_column(self, values: List, field: pa.Field) -> pa.Array:
+        """Builds an arrow array of type `field.type` out of `values`.
+
+        If some values don't match the column type, every value is coerced
+        to it. Values that can't be coerced are saved as null.
+
+        # Parameters
+            `values` (List): Column values.
+            `field` (pa.Field): Column name and type.
+
+        # Returns
+            pa.Array: Column values as an arrow array.
+        """
+        try:
+            return pa.array(values, type=field.type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            self.logger.warning(f"Coercing mismatched values in {field.name}")
+
+        return pa.array(
+            [self.coerce_value(value, field.type) for value in values],
+            type=field.type,
+        )
+
+    def coerce_value(self, value: Any, data_type: pa.DataType) -> Any:
+        """Converts `value` to the Python type matching `data_type`.
+
+        # Parameters
+            `value` (Any): Value to convert.
+            `data_type` (pa.DataType): Either string or int64.
+
+        # Returns
+            Any: Converted value, or None if it can't be converted.
+        """
+        if value is None:
+            return None
+
+        if pa.types.is_string(data_type):
+            return str(value)
+
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
     def construct_output_filepath(self, current_date: datetime) -> str:
         """Helper function to get output csv file path.
 
@@ -1,5 +1,7 @@
+import asyncio
+from itertools import islice
 import time
-from typing import Generator
+from typing import Generator, List
 import logging
 from datetime import datetime
 from random import randint
@@ -28,18 +30,57 @@ class Scraper:
 
     def begin(self):
         """Initiates scraping procedure."""
-        for date_start in self.date_iterable():
-            date_end = date_start + self.config.time_delta
-            date_range_string = self.construct_date_range_string(
-                date_start,
-                date_end
-            )
-
-            try:
-                self.logger.info(f"Working date range: {date_range_string}")
-                self.fetch_articles_in_date_range(date_start, date_end)
-            except Exception:
-                self.logger.warning(f"No artciles in {date_range_string}")
+        asyncio.run(self.scrape())
+
+    async def scrape(self):
+        """Scrapes date ranges concurrently in batches of `config.max_concurrency`.
+
+        The last scraped date is only saved once every date range in a batch
+        is done. Until then, the progress of each range is kept in the config
+        and saved when scraping stops, so an interrupted run resumes every
+        range from the page after the last saved one.
+        """
+        date_starts = self.date_iterable()
+
+        try:
+            while True:
+                batch: List[datetime] = list(
+                    islice(date_starts, self.config.max_concurrency)
+                )
+
+                if len(batch) == 0:
+                    break
+
+                await asyncio.gather(*[
+                    self.scrape_date_range(date_start)
+                    for date_start in batch
+                ])
+                self.config.update(
+                    newly_added=0,
+                    last_scrapped_date=batch[-1] + self.config.time_delta
+                )
+        finally:
+            self.config.flush()
+            await self.requester.close()
+            self.processor.close()
+
+    async def scrape_date_range(self, date_start: datetime) -> None:
+        """Scrapes a single date range starting at `date_start`.
+
+        # Parameters
+            `date_start` (datetime): Earliest date of publication.
+        """
+        date_end = date_start + self.config.time_delta
+        date_range_string = self.construct_date_range_string(
+            date_start,
+            date_end
+        )
+
+        try:
+            self.logger.info(f"Working date range: {date_range_string}")
+            await self.fetch_articles_in_date_range(date_start, date_end)
+        except Exception:
+            self.logger.warning(f"No artciles in {date_range_string}")
 
     def construct_date_range_string(self, date_start: datetime, date_end: datetime) -> str:
         """Constructs date range string.
@@ -57,9 +98,13 @@ class Scraper:
         string_end = date_to_string(date_end)
         return f"{string_start} to {string_end}"
 
-    def fetch_articles_in_date_range(self, date_start: datetime, date_end: datetime) -> None:
+    async def fetch_articles_in_date_range(self, date_start: datetime, date_end: datetime) -> None:
         """Fetchs articles within `date_start` and `date_end`.
 
+        Resumes from the progress recorded in the config for this range.
+        The next page is requested in the background while the current
+        one is being processed and saved.
+
         # Parameters
             `date_start` (datetime): Earliest date of publication.
             `date_end` (datetime): Latest date of publication.
@@ -67,21 +112,45 @@ class Scraper:
         # Raises
             Exception: Raised if response object is None.
         """
-        for offset in self.offset_iterable():
-            response = self.requester(date_start, date_end, offset)
+        next_offset = self.config.range_next_offset(date_start)
 
-            if int(response["total"]) is 0 or len(response["items"]) is 0:
-                self.logger.info("response total is 0. Exiting loop.")
-                break
+        if next_offset is None:
+            self.logger.info("Date range already scraped. Skipping.")
+            return
 
-            processed_items = self.processor(response["items"])
-            self.saver(processed_items, date_start)
-            self.config.update(
-                newly_added=len(processed_items),
-                last_scrapped_date=date_end
-            )
+        offsets = self.offset_iterable(next_offset)
+        next_response = asyncio.create_task(
+            self.requester(date_start, date_end, next(offsets))
+        )
 
-            self.logger.info(f"Total scraped: {self.config.total}")
+        try:
+            while True:
+                response = await next_response
+                total = int(response["total"])
+                items = response["items"]
+
+                if total == 0 or len(items) == 0:
+                    self.logger.info("response total is 0. Exiting loop.")
+                    self.config.update_range_in_memory(
+                        date_start, next_offset=None, newly_added=0
+                    )
+                    break
+
+                next_offset = next(offsets)
+                next_response = asyncio.create_task(
+                    self.requester(date_start, date_end, next_offset)
+                )
+                processed_items = await asyncio.to_thread(self.processor, items)
+                self.saver(processed_items, date_start)
+                self.config.update_range_in_memory(
+                    date_start,
+                    next_offset=next_offset,
+                    newly_added=len(processed_items),
+                )
+
+                self.logger.info(f"Total scraped: {self.config.total}")
+        finally:
+            next_response.cancel()
 
     def random_sleep(self):
         """Sleep for a random amount of time within range 
@@ -110,16 +179,17 @@ class Scraper:
 
         self.logger.info("Reached current date. Exiting.")
 
-    def offset_iterable(self) -> Generator[int, None, None]:
+    def offset_iterable(self, offset: int = 0) -> Generator[int, None, None]:
         """An offset iterable that increases offset value as many times it's called.
 
         The amount of offset increase is determined by the value of `self.config.limit`
 
+        Args:
+            offset (int): First offset value. Defaults to 0.
+
         Yields:
             Generator[int, None, None]: Current offset value.
         """
-        offset: int = 0
-
         while True:
             yield offset
             offset += self.config.limit
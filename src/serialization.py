@@ -0,0 +1,38 @@
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+
+def loads(data: bytes):
+    """Deserializes json `data` into Python objects.
+
+    Uses `orjson` when it is installed and falls back to the standard
+    library `json` module otherwise.
+
+    # Parameters
+        `data` (bytes): Raw json data.
+
+    # Returns
+        Any: Deserialized Python object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def dumps(obj) -> bytes:
+    """Serializes `obj` into indented json bytes.
+
+    # Parameters
+        `obj` (Any): Python object to serialize.
+
+    # Returns
+        bytes: Serialized json data.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
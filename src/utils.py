@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import lru_cache
 import logging
 
 
@@ -31,6 +32,7 @@ def setup_logger(
     return logger
 
 
+@lru_cache(maxsize=1024)
 def string_to_date(date_str: str) -> datetime:
     """Converts date string of format "%d-%m-%Y" to `datetime` object.
 
@@ -43,6 +45,7 @@ def string_to_date(date_str: str) -> datetime:
     return datetime.strptime(date_str, "%d-%m-%Y")
 
 
+@lru_cache(maxsize=1024)
 def date_to_string(date: datetime) -> str:
     """Converts `datetime` object to string of format "%d-%m-%Y"
 